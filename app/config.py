@@ -9,6 +9,7 @@ class Settings:
     MINIMAX_API_KEY: str = os.getenv("MINIMAX_API_KEY", "")
     OUTPUT_DIR: str = os.getenv("OUTPUT_DIR", "/app/output") # Default inside container
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    MINIMAX_API_BASE: str = os.getenv("MINIMAX_API_BASE", "https://api.minimax.chat")
     # 默认音频文件路径
     DEFAULT_INTRO_FILE: str = os.path.join(os.path.dirname(__file__), "assets", "intro.mp3")
     DEFAULT_OUTRO_FILE: str = os.path.join(os.path.dirname(__file__), "assets", "outro.mp3")
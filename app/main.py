@@ -1,12 +1,25 @@
 from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi.responses import JSONResponse
 from .models import TTSRequest, TTSResponse
 from .tts_processor import process_long_text_to_speech
 from .config import settings
+from .utils import (
+    check_ffmpeg,
+    audio_round_trip,
+    preload_audio_file,
+    get_http_client,
+    close_http_client
+)
+import asyncio
 import os
+import time
 import uuid
 
 app = FastAPI()
 
+# 预热状态，供 /ready 使用；只有 ffmpeg 检查和编解码往返成功才视为就绪
+warmup_state = {"ready": False, "steps": {}}
+
 @app.post("/generate_tts", response_model=TTSResponse)
 async def generate_tts_endpoint(request: TTSRequest, background_tasks: BackgroundTasks):
     if not settings.MINIMAX_API_KEY or not settings.MINIMAX_GROUP_ID:
@@ -94,6 +107,60 @@ async def generate_tts_endpoint(request: TTSRequest, background_tasks: Backgroun
 async def health_check():
     return {"status": "ok"}
 
+@app.get("/ready")
+async def readiness_check():
+    status_code = 200 if warmup_state["ready"] else 503
+    return JSONResponse(
+        status_code=status_code,
+        content={"status": "ready" if warmup_state["ready"] else "not_ready", **warmup_state}
+    )
+
+async def _run_warmup_step(name: str, func, *args):
+    """执行一个预热步骤并记录耗时和结果，失败不会抛出。"""
+    start = time.perf_counter()
+    try:
+        result = func(*args)
+        if asyncio.iscoroutine(result):
+            result = await result
+        step = {"ok": True, "result": result}
+    except Exception as e:
+        print(f"Warm-up step {name} failed: {e}")
+        step = {"ok": False, "error": str(e)}
+    step["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    warmup_state["steps"][name] = step
+    return step["ok"]
+
+def _preload_default_audio() -> dict:
+    """预加载默认 intro/outro，返回每个文件的时长（毫秒），缺失的文件记为 None。"""
+    loaded = {}
+    for path in (settings.DEFAULT_INTRO_FILE, settings.DEFAULT_OUTRO_FILE):
+        audio = preload_audio_file(path)
+        if audio is None:
+            print(f"Default audio file not found, skipping preload: {path}")
+        loaded[os.path.basename(path)] = len(audio) if audio is not None else None
+    return loaded
+
+async def _open_http_pool() -> int:
+    """创建共享 HTTP 客户端并与 MiniMax 建立连接（DNS + TLS），返回响应状态码。"""
+    response = await get_http_client().head(settings.MINIMAX_API_BASE, timeout=10.0)
+    return response.status_code
+
+async def warm_up():
+    ffmpeg_ok = await _run_warmup_step("ffmpeg", check_ffmpeg)
+    round_trip_ok = ffmpeg_ok and await _run_warmup_step(
+        "audio_round_trip", asyncio.to_thread, audio_round_trip
+    )
+    if ffmpeg_ok:
+        await _run_warmup_step("preload_default_audio", asyncio.to_thread, _preload_default_audio)
+    # 网络预连接失败只记录，不影响就绪状态，避免外部服务抖动导致所有实例下线
+    await _run_warmup_step("http_pool", _open_http_pool)
+    warmup_state["ready"] = bool(round_trip_ok)
+
 @app.on_event("startup")
 async def startup_event():
-    os.makedirs(settings.OUTPUT_DIR, exist_ok=True)
\ No newline at end of file
+    os.makedirs(settings.OUTPUT_DIR, exist_ok=True)
+    await warm_up()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await close_http_client()
\ No newline at end of file
@@ -9,6 +9,7 @@ from .utils import (
     split_text_into_chunks,
     format_ms_to_srt_time,
     download_audio_file,
+    get_http_client,
     process_audio_segment,
     adjust_srt_timestamps,
     merge_audio_segments
@@ -50,7 +51,7 @@ async def process_chunk(client: httpx.AsyncClient, chunk_text: str, enable_subti
         "audio_setting": {"sample_rate": 32000, "bitrate": 128000, "format": "mp3"},
         "subtitle_enable": enable_subtitles
     }
-    url = f"https://api.minimax.chat/v1/t2a_v2?GroupId={settings.MINIMAX_GROUP_ID}"
+    url = f"{settings.MINIMAX_API_BASE}/v1/t2a_v2?GroupId={settings.MINIMAX_GROUP_ID}"
     headers = {
         "Authorization": f"Bearer {settings.MINIMAX_API_KEY}",
         "Content-Type": "application/json"
@@ -158,12 +159,9 @@ async def process_long_text_to_speech(
 
     # 处理主要 TTS 内容
     chunks = split_text_into_chunks(text)
-    tasks = []
-    async with httpx.AsyncClient() as client:
-        for chunk in chunks:
-            tasks.append(process_chunk(client, chunk, enable_subtitles, temp_dir))
-
-        results = await asyncio.gather(*tasks)
+    client = get_http_client()
+    tasks = [process_chunk(client, chunk, enable_subtitles, temp_dir) for chunk in chunks]
+    results = await asyncio.gather(*tasks)
 
     successful_results = [r for r in results if r and r.get("success")]
     errors = [r.get("error") for r in results if r and not r.get("success")]
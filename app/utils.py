@@ -1,12 +1,70 @@
+import io
 import math
+import shutil
 from datetime import timedelta
 import httpx
 from pydub import AudioSegment
+from pydub.utils import get_prober_name
 import os
 from typing import Optional, Tuple
 
 MAX_CHUNK_LENGTH = 5000 # Example limit
 
+# 进程内共享的 HTTP 客户端（复用连接池），由 get_http_client 懒加载
+_http_client: Optional[httpx.AsyncClient] = None
+
+# 预加载的本地音频，键为文件路径，值为 (mtime, AudioSegment)
+_preloaded_audio: dict[str, Tuple[float, AudioSegment]] = {}
+
+def get_http_client() -> httpx.AsyncClient:
+    """返回共享的 AsyncClient，首次调用时创建。"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient()
+    return _http_client
+
+async def close_http_client() -> None:
+    """关闭共享的 AsyncClient，释放连接池。"""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
+def check_ffmpeg() -> dict:
+    """检查 pydub 使用的 ffmpeg/ffprobe 是否可用，返回其实际路径。"""
+    converter = shutil.which(AudioSegment.converter)
+    prober = shutil.which(get_prober_name())
+    if not converter:
+        raise RuntimeError(f"Audio converter not found: {AudioSegment.converter}")
+    if not prober:
+        raise RuntimeError("Audio prober (ffprobe/avprobe) not found")
+    return {"converter": converter, "prober": prober}
+
+def audio_round_trip(duration_ms: int = 100) -> int:
+    """用一段静音做一次 mp3 编码/解码往返，返回解码后的时长（毫秒）。"""
+    buffer = io.BytesIO()
+    AudioSegment.silent(duration=duration_ms).export(buffer, format="mp3", bitrate="128k")
+    buffer.seek(0)
+    return len(AudioSegment.from_file(buffer, format="mp3"))
+
+def preload_audio_file(audio_path: str) -> Optional[AudioSegment]:
+    """解码本地音频并缓存，之后 process_audio_segment 直接复用；文件不存在时返回 None。"""
+    if not os.path.exists(audio_path):
+        return None
+    audio = AudioSegment.from_file(audio_path)
+    _preloaded_audio[audio_path] = (os.path.getmtime(audio_path), audio)
+    return audio
+
+def _load_audio_file(audio_path: str) -> AudioSegment:
+    """读取音频文件，优先使用预加载且未被修改的缓存。"""
+    cached = _preloaded_audio.get(audio_path)
+    if cached is not None:
+        mtime, audio = cached
+        if os.path.exists(audio_path) and os.path.getmtime(audio_path) == mtime:
+            return audio
+        del _preloaded_audio[audio_path]
+    return AudioSegment.from_file(audio_path)
+
 def split_text_into_chunks(text: str, max_length: int = MAX_CHUNK_LENGTH) -> list[str]:
     """将文本分割成块，优先考虑自然断点，支持中英文标点。"""
     chunks = []
@@ -60,12 +118,11 @@ def format_ms_to_srt_time(milliseconds: int) -> str:
 async def download_audio_file(url: str, temp_path: str) -> bool:
     """从 URL 下载音频文件到临时路径"""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            with open(temp_path, 'wb') as f:
-                f.write(response.content)
-            return True
+        response = await get_http_client().get(url)
+        response.raise_for_status()
+        with open(temp_path, 'wb') as f:
+            f.write(response.content)
+        return True
     except Exception as e:
         print(f"Error downloading audio file: {e}")
         return False
@@ -79,7 +136,7 @@ def process_audio_segment(
 ) -> Optional[AudioSegment]:
     """处理音频片段，支持裁剪和淡入淡出"""
     try:
-        audio = AudioSegment.from_file(audio_path)
+        audio = _load_audio_file(audio_path)
         
         # 如果指定了开始和结束时间，进行裁剪
         if start_time is not None: